@@ -691,6 +691,49 @@ class TestAssertClose(TestCase):
         for fn in assert_close_with_inputs(actual, expected):
             fn(rtol=0.0, atol=eps * 2)
 
+    def test_matching_large_batch_of_pairs(self):
+        # More than eight CPU tensor pairs are compared on a thread pool in assert_equal.
+        expected = [torch.full((2,), float(idx)) for idx in range(16)]
+        actual = [tensor.clone() for tensor in expected]
+
+        torch.testing.assert_close(actual, expected)
+
+    def test_mismatching_values_large_batch_of_pairs(self):
+        expected = [torch.full((2,), float(idx)) for idx in range(16)]
+        actual = [tensor.clone() for tensor in expected]
+        actual[3] += 1
+        actual[11] += 1
+
+        # Even with the pairs compared in parallel, the first failure in pair order is reported.
+        with self.assertRaisesRegex(AssertionError, re.escape("item [3]")):
+            torch.testing.assert_close(actual, expected)
+
+    def test_matching_compare_in_source_dtype(self):
+        # The offsets are exactly representable in the respective dtype and lie within its default tolerances.
+        for dtype, offset in ((torch.float16, 2 ** -10), (torch.bfloat16, 2 ** -7)):
+            actual = torch.tensor([1.0], dtype=dtype)
+            expected = torch.tensor([1.0 + offset], dtype=dtype)
+
+            torch.testing._comparison.assert_equal(
+                actual,
+                expected,
+                pair_types=(torch.testing._comparison.TensorLikePair,),
+                _compare_in_source_dtype=True,
+            )
+
+    def test_mismatching_values_compare_in_source_dtype(self):
+        for dtype in (torch.float16, torch.bfloat16):
+            actual = torch.tensor([1.0], dtype=dtype)
+            expected = torch.tensor([2.0], dtype=dtype)
+
+            with self.assertRaisesRegex(AssertionError, "Tensor-likes are not close"):
+                torch.testing._comparison.assert_equal(
+                    actual,
+                    expected,
+                    pair_types=(torch.testing._comparison.TensorLikePair,),
+                    _compare_in_source_dtype=True,
+                )
+
     # TODO: the code that this test was designed for was removed in https://github.com/pytorch/pytorch/pull/56058
     #  We need to check if this test is still needed or if this behavior is now enabled by default.
     def test_matching_conjugate_bit(self):
@@ -700,6 +743,25 @@ class TestAssertClose(TestCase):
         for fn in assert_close_with_inputs(actual, expected):
             fn()
 
+    def test_mismatching_conjugate_view_of_base(self):
+        expected = torch.tensor([complex(1, 1)])
+        actual = expected.conj()
+
+        # The conjugate view shares data pointer and strides with its base, but reads different values. equal_nan is
+        # set to also exercise the aliasing shortcut for floating point and complex dtypes.
+        for fn in assert_close_with_inputs(actual, expected):
+            with self.assertRaises(AssertionError):
+                fn(equal_nan=True)
+
+    def test_mismatching_negative_view_of_base(self):
+        expected = torch.tensor([1])
+        actual = torch._neg_view(expected)
+
+        # The negative view shares data pointer and strides with its base, but reads different values.
+        for fn in assert_close_with_inputs(actual, expected):
+            with self.assertRaises(AssertionError):
+                fn()
+
     def test_matching_nan(self):
         nan = float("NaN")
 
@@ -1076,6 +1138,22 @@ class TestAssertCloseSparseCOO(TestCase):
             with self.assertRaisesRegex(AssertionError, re.escape("Sparse COO values")):
                 fn()
 
+    def test_mismatching_values_conjugate_view(self):
+        indices = (
+            (0, 1),
+            (1, 0),
+        )
+        values = torch.tensor([complex(1, 1), complex(2, 2)])
+        actual = torch.sparse_coo_tensor(indices, values.conj(), size=(2, 2))
+        expected = torch.sparse_coo_tensor(indices, values, size=(2, 2))
+
+        # If the conjugate view is preserved by the constructor, the value members of both inputs alias the same
+        # memory while reading different values, exercising the view bit handling of the aliasing shortcut on derived
+        # tensors. Otherwise the values simply differ numerically. Either way the comparison has to fail.
+        for fn in assert_close_with_inputs(actual, expected):
+            with self.assertRaisesRegex(AssertionError, re.escape("Sparse COO values")):
+                fn(equal_nan=True)
+
 
 @unittest.skipIf(IS_FBCODE or IS_SANDCASTLE, "Not all sandcastle jobs support CSR testing")
 class TestAssertCloseSparseCSR(TestCase):
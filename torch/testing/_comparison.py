@@ -1,13 +1,13 @@
 import abc
 import cmath
 import collections.abc
+import concurrent.futures
 import contextlib
+import math
 from typing import NoReturn, Callable, Sequence, List, Union, Optional, Type, Tuple, Any, Collection
 
 import torch
 
-from ._core import _unravel_index
-
 try:
     import numpy as np
 
@@ -37,10 +37,27 @@ class ErrorMeta(Exception):
         return self.type(msg)
 
 
+_ZERO_TOLERANCES = (0.0, 0.0)
+
+
+class _DtypePrecisions(dict):
+    """Precision mapping that defaults to zero tolerances for unknown dtypes.
+
+    Returning the default from :meth:`__missing__` keeps the lookup on the single C-level ``dict`` fast path for the
+    known dtypes, in contrast to :meth:`dict.get`, which re-resolves the bound method and builds the default for
+    every call.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, dtype: torch.dtype) -> Tuple[float, float]:
+        return _ZERO_TOLERANCES
+
+
 # Some analysis of tolerance by logging tests from test_torch.py can be found in
 # https://github.com/pytorch/pytorch/pull/32538.
 # {dtype: (rtol, atol)}
-_DTYPE_PRECISIONS = {
+_DTYPE_PRECISIONS = _DtypePrecisions({
     torch.float16: (0.001, 1e-5),
     torch.bfloat16: (0.016, 1e-5),
     torch.float32: (1.3e-6, 1e-5),
@@ -48,7 +65,7 @@ _DTYPE_PRECISIONS = {
     torch.complex32: (0.001, 1e-5),
     torch.complex64: (1.3e-6, 1e-5),
     torch.complex128: (1e-7, 1e-7),
-}
+})
 # The default tolerances of torch.float32 are used for quantized dtypes, because quantized tensors are compared in
 # their dequantized and floating point representation. For more details see `TensorLikePair._compare_quantized_values`
 _DTYPE_PRECISIONS.update(
@@ -59,6 +76,22 @@ _DTYPE_PRECISIONS.update(
 )
 
 
+# Maps an input dtype to the dtype the closeness comparison is performed in. Reduced precision dtypes only need to be
+# promoted to the single precision variant of their category: every float16 / bfloat16 value and the difference of any
+# two of them is exactly representable in float32, so the comparison gains nothing from a double precision target
+# while halving the size of the promotion copies. Integral and boolean dtypes, i.e. everything absent from this table,
+# go to int64 to keep the difference computation free of overflow.
+_COMPARISON_DTYPES = {
+    torch.float16: torch.float32,
+    torch.bfloat16: torch.float32,
+    torch.float32: torch.float32,
+    torch.float64: torch.float64,
+    torch.complex32: torch.complex64,
+    torch.complex64: torch.complex64,
+    torch.complex128: torch.complex128,
+}
+
+
 def default_tolerances(*inputs: Union[torch.Tensor, torch.dtype]) -> Tuple[float, float]:
     """Returns the default absolute and relative testing tolerances for a set of inputs based on the dtype.
 
@@ -67,16 +100,24 @@ def default_tolerances(*inputs: Union[torch.Tensor, torch.dtype]) -> Tuple[float
     Returns:
         (Tuple[float, float]): Loosest tolerances of all input dtypes.
     """
-    dtypes = []
+    # This is called at least once for every pair of tensors that is compared. Thus, the tolerances are accumulated in
+    # a single pass rather than collecting the dtypes in an intermediate list and `zip`'ing the tolerances afterwards.
+    max_rtol = 0.0
+    max_atol = 0.0
     for input in inputs:
-        if isinstance(input, torch.Tensor):
-            dtypes.append(input.dtype)
+        # Exact type check upfront, since this is significantly cheaper than `isinstance`, which has to walk the MRO.
+        if type(input) is torch.Tensor or isinstance(input, torch.Tensor):
+            dtype = input.dtype
         elif isinstance(input, torch.dtype):
-            dtypes.append(input)
+            dtype = input
         else:
             raise TypeError(f"Expected a torch.Tensor or a torch.dtype, but got {type(input)} instead.")
-    rtols, atols = zip(*[_DTYPE_PRECISIONS.get(dtype, (0.0, 0.0)) for dtype in dtypes])
-    return max(rtols), max(atols)
+        rtol, atol = _DTYPE_PRECISIONS[dtype]
+        if rtol > max_rtol:
+            max_rtol = rtol
+        if atol > max_atol:
+            max_atol = atol
+    return max_rtol, max_atol
 
 
 def get_tolerances(
@@ -195,10 +236,58 @@ def make_scalar_mismatch_msg(
     )
 
 
+def _mismatch_stats(
+    actual: torch.Tensor, expected: torch.Tensor, mismatches: torch.Tensor
+) -> Tuple[int, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Computes the mismatch statistics reported by :func:`make_tensor_mismatch_msg`.
+
+    Apart from the mismatch count, which is a by-product of the :func:`torch.nonzero` call, the computation is kept
+    free of data-dependent control flow and scalar transfers, so all returned values are tensors living on the input
+    device.
+
+    Returns:
+        (Tuple[int, Tensor, Tensor, Tensor]): Total number of mismatches, maximum absolute difference, maximum
+            relative difference, and the multi-dimensional indices of both maxima as rows of a ``2 x ndim`` tensor.
+    """
+    if mismatches.ndim == 0:
+        actual, expected, mismatches = (tensor.reshape(1) for tensor in (actual, expected, mismatches))
+
+    # Mismatches are usually sparse compared to the total number of elements. Gathering the mismatched elements first
+    # makes the differences and reductions operate on tensors of the mismatch count rather than the full input size.
+    # `torch.nonzero` directly yields the multi-dimensional indices in row-major order, so no flattening of the
+    # inputs and no unraveling of the winning indices is needed, and the position of the maxima within the gathered
+    # subset maps back to the same index that a full-size reduction would report.
+    mismatch_idcs = torch.nonzero(mismatches)
+    index = mismatch_idcs.unbind(1)
+    a_mismatches = actual[index]
+    b_mismatches = expected[index]
+
+    abs_diff = torch.abs(a_mismatches - b_mismatches)
+    rel_diff = abs_diff / torch.abs(b_mismatches)
+
+    # If both difference tensors share a dtype, e.g. for floating point inputs, stacking them lets a single batched
+    # reduction produce both maxima and their positions in one kernel launch. For integral inputs the absolute
+    # difference stays integral while the relative difference is floating point, so they are reduced separately to
+    # keep the absolute maximum an integer.
+    if abs_diff.dtype == rel_diff.dtype:
+        max_diffs, max_diff_idcs = torch.max(torch.stack((abs_diff, rel_diff)), 1)
+        max_abs_diff, max_rel_diff = max_diffs.unbind()
+    else:
+        max_abs_diff, max_abs_diff_idx = torch.max(abs_diff, 0)
+        max_rel_diff, max_rel_diff_idx = torch.max(rel_diff, 0)
+        max_diff_idcs = torch.stack((max_abs_diff_idx, max_rel_diff_idx))
+
+    # `torch.nonzero` has to synchronize to size its output, so the mismatch count is already known on the host and
+    # a separate sum reduction would only repeat that work.
+    total_mismatches = mismatch_idcs.shape[0]
+
+    return total_mismatches, max_abs_diff, max_rel_diff, mismatch_idcs[max_diff_idcs]
+
+
 def make_tensor_mismatch_msg(
     actual: torch.Tensor,
     expected: torch.Tensor,
-    mismatches: torch.Tensor,
+    matches: torch.Tensor,
     *,
     rtol: float,
     atol: float,
@@ -209,43 +298,52 @@ def make_tensor_mismatch_msg(
     Args:
         actual (torch.Tensor): Actual tensor.
         expected (torch.Tensor): Expected tensor.
-        mismatches (torch.Tensor): Boolean mask of the same shape as ``actual`` and ``expected`` that indicates the
-            location of mismatches.
+        matches (torch.Tensor): Boolean mask of the same shape as ``actual`` and ``expected`` that indicates the
+            location of matches. Since the caller has no further use for it, the mask is inverted in place rather
+            than allocating a second one.
         rtol (float): Relative tolerance.
         atol (float): Absolute tolerance.
         identifier (Optional[Union[str, Callable[[str], str]]]): Optional description for the tensors. Can be passed
             as callable in which case it will be called by the default value to create the description at runtime.
             Defaults to "Tensor-likes".
     """
-    number_of_elements = mismatches.numel()
-    total_mismatches = torch.sum(mismatches).item()
+    number_of_elements = matches.numel()
+    mismatches = matches.logical_not_()
+
+    total_mismatches, max_abs_diff, max_rel_diff, max_diff_idcs = _mismatch_stats(actual, expected, mismatches)
+
+    # Every scalar pulled from a CUDA tensor triggers a device-to-host synchronization. Thus, the scalars are
+    # transferred together in a single `Tensor.tolist()` call each rather than with an individual `Tensor.item()`
+    # call per value. The integral and the floating point scalars are kept apart to preserve their types in the
+    # message, e.g. the maximum absolute difference of integral inputs should be reported as an integer.
+    max_diff_idcs_list = max_diff_idcs.flatten().tolist()
+    if max_abs_diff.dtype == max_rel_diff.dtype:
+        max_abs_diff, max_rel_diff = torch.stack((max_abs_diff, max_rel_diff)).tolist()
+    else:
+        max_abs_diff = max_abs_diff.item()
+        max_rel_diff = max_rel_diff.item()
+
     extra = (
         f"Mismatched elements: {total_mismatches} / {number_of_elements} "
         f"({total_mismatches / number_of_elements:.1%})"
     )
 
-    a_flat = actual.flatten()
-    b_flat = expected.flatten()
-    matches_flat = ~mismatches.flatten()
+    # Mirroring `torch.testing._core._unravel_index`, the index into a zero-dimensional tensor is reported as plain
+    # ``0`` and indices into a one-dimensional tensor as plain integers rather than singleton tuples.
+    row_length = max(mismatches.ndim, 1)
+    max_abs_diff_row, max_rel_diff_row = max_diff_idcs_list[:row_length], max_diff_idcs_list[row_length:]
+    max_abs_diff_idx = max_abs_diff_row[0] if row_length == 1 else tuple(max_abs_diff_row)
+    max_rel_diff_idx = max_rel_diff_row[0] if row_length == 1 else tuple(max_rel_diff_row)
 
-    abs_diff = torch.abs(a_flat - b_flat)
-    # Ensure that only mismatches are used for the max_abs_diff computation
-    abs_diff[matches_flat] = 0
-    max_abs_diff, max_abs_diff_flat_idx = torch.max(abs_diff, 0)
-
-    rel_diff = abs_diff / torch.abs(b_flat)
-    # Ensure that only mismatches are used for the max_rel_diff computation
-    rel_diff[matches_flat] = 0
-    max_rel_diff, max_rel_diff_flat_idx = torch.max(rel_diff, 0)
     return _make_mismatch_msg(
         default_identifier="Tensor-likes",
         identifier=identifier,
         extra=extra,
-        abs_diff=max_abs_diff.item(),
-        abs_diff_idx=_unravel_index(max_abs_diff_flat_idx.item(), mismatches.shape),
+        abs_diff=max_abs_diff,
+        abs_diff_idx=max_abs_diff_idx,
         atol=atol,
-        rel_diff=max_rel_diff.item(),
-        rel_diff_idx=_unravel_index(max_rel_diff_flat_idx.item(), mismatches.shape),
+        rel_diff=max_rel_diff,
+        rel_diff_idx=max_rel_diff_idx,
         rtol=rtol,
     )
 
@@ -267,6 +365,11 @@ class Pair(abc.ABC):
     be used to automatically handle overwriting the message with a user supplied one and id handling.
     """
 
+    # Slotted attributes avoid allocating a per-instance ``__dict__``, which matters when a pair is constructed for
+    # every leaf of a large input structure. Subclasses in other modules that do not declare ``__slots__`` simply get
+    # a ``__dict__`` back and keep working.
+    __slots__ = ("actual", "expected", "id", "msg", "_unknown_parameters")
+
     def __init__(
         self,
         actual: Any,
@@ -282,10 +385,33 @@ class Pair(abc.ABC):
         self.msg = msg
         self._unknown_parameters = unknown_parameters
 
+    @classmethod
+    def can_handle(cls, actual: Any, expected: Any) -> bool:
+        """Cheaply checks whether the pair type could handle the inputs, without constructing anything.
+
+        This is a pre-filter for the dispatch in :func:`originate_pairs`: returning ``False`` guarantees that the
+        construction would raise :class:`UnsupportedInputs`, while returning ``True`` makes no promise. The default
+        accepts everything. Subclasses that loosen the input handling of their parent, e.g. by converting additional
+        types, must override this accordingly.
+        """
+        return True
+
+    @classmethod
+    def try_build(cls, actual: Any, expected: Any, *, id: Tuple[Any, ...], **options: Any) -> Optional["Pair"]:
+        """Tries to construct the pair and returns ``None`` if the inputs are unsupported.
+
+        Turning the :class:`UnsupportedInputs` control flow into a return value avoids the cost of propagating an
+        exception through the constructor chain for every pair type that does not handle the inputs.
+        """
+        try:
+            return cls(actual, expected, id=id, **options)
+        except UnsupportedInputs:
+            return None
+
     @staticmethod
-    def _check_inputs_isinstance(*inputs: Any, cls: Union[Type, Tuple[Type, ...]]):
-        """Checks if all inputs are instances of a given class and raise :class:`UnsupportedInputs` otherwise."""
-        if not all(isinstance(input, cls) for input in inputs):
+    def _check_inputs_isinstance(actual: Any, expected: Any, *, cls: Union[Type, Tuple[Type, ...]]):
+        """Checks if both inputs are instances of a given class and raise :class:`UnsupportedInputs` otherwise."""
+        if not (isinstance(actual, cls) and isinstance(expected, cls)):
             raise UnsupportedInputs()
 
     def _make_error_meta(self, type: Type[Exception], msg: str, *, id: Tuple[Any, ...] = ()) -> ErrorMeta:
@@ -339,7 +465,14 @@ class ObjectPair(Pair):
 
     """
 
+    __slots__ = ()
+
     def compare(self) -> None:
+        # Identical objects are considered equal without invoking `==`, which can be arbitrarily expensive for user
+        # defined types. This mirrors the reflexivity shortcut of Python's own container comparisons.
+        if self.actual is self.expected:
+            return
+
         try:
             equal = self.actual == self.expected
         except Exception as error:
@@ -354,6 +487,12 @@ class ObjectPair(Pair):
 class NonePair(Pair):
     """Pair for ``None`` inputs."""
 
+    __slots__ = ()
+
+    @classmethod
+    def can_handle(cls, actual: Any, expected: Any) -> bool:
+        return actual is None or expected is None
+
     def __init__(self, actual: Any, expected: Any, **other_parameters: Any) -> None:
         if not (actual is None or expected is None):
             raise UnsupportedInputs()
@@ -374,17 +513,21 @@ class BooleanPair(Pair):
 
     """
 
+    __slots__ = ()
+
+    # Class attribute rather than a property, since the latter would rebuild the tuple for every pair construction.
+    _supported_types: Tuple[Type, ...] = (bool, np.bool_) if NUMPY_AVAILABLE else (bool,)
+
+    @classmethod
+    def can_handle(cls, actual: Any, expected: Any) -> bool:
+        # The check is deliberately on either input instead of both: an unsupported counterpart still has to reach
+        # the constructor, so the mismatch is reported there rather than silently deferred to a later pair type.
+        return isinstance(actual, cls._supported_types) or isinstance(expected, cls._supported_types)
+
     def __init__(self, actual: Any, expected: Any, *, id: Tuple[Any, ...], **other_parameters: Any) -> None:
         actual, expected = self._process_inputs(actual, expected, id=id)
         super().__init__(actual, expected, **other_parameters)
 
-    @property
-    def _supported_types(self) -> Tuple[Type, ...]:
-        cls: List[Type] = [bool]
-        if NUMPY_AVAILABLE:
-            cls.append(np.bool_)
-        return tuple(cls)
-
     def _process_inputs(self, actual: Any, expected: Any, *, id: Tuple[Any, ...]) -> Tuple[bool, bool]:
         self._check_inputs_isinstance(actual, expected, cls=self._supported_types)
         actual, expected = [self._to_bool(bool_like, id=id) for bool_like in (actual, expected)]
@@ -432,12 +575,31 @@ class NumberPair(Pair):
     +------------------+-------------------------------+
     """
 
+    __slots__ = ("rtol", "atol", "equal_nan", "check_dtype")
+
     _TYPE_TO_DTYPE = {
         int: torch.int64,
         float: torch.float64,
         complex: torch.complex128,
     }
     _NUMBER_TYPES = tuple(_TYPE_TO_DTYPE.keys())
+    # Class attribute rather than a property, since the latter would rebuild the tuple for every pair construction.
+    _supported_types: Tuple[Type, ...] = (*_NUMBER_TYPES, np.number) if NUMPY_AVAILABLE else _NUMBER_TYPES
+    # Precomputed default tolerances per Python type, so the common case of omitted tolerances is a single dictionary
+    # lookup instead of going through `get_tolerances` and `default_tolerances` for every pair.
+    _TYPE_TO_TOLERANCES = {type: _DTYPE_PRECISIONS[dtype] for type, dtype in _TYPE_TO_DTYPE.items()}
+
+    @classmethod
+    def can_handle(cls, actual: Any, expected: Any) -> bool:
+        # See `BooleanPair.can_handle` for the rationale of checking either input instead of both.
+        return isinstance(actual, cls._supported_types) or isinstance(expected, cls._supported_types)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses overriding `_TYPE_TO_DTYPE`, e.g. to compare in lower precision, need the tolerance table to be
+        # rebuilt from their mapping.
+        if "_TYPE_TO_DTYPE" in cls.__dict__ and "_TYPE_TO_TOLERANCES" not in cls.__dict__:
+            cls._TYPE_TO_TOLERANCES = {type: _DTYPE_PRECISIONS[dtype] for type, dtype in cls._TYPE_TO_DTYPE.items()}
 
     def __init__(
         self,
@@ -454,19 +616,19 @@ class NumberPair(Pair):
         actual, expected = self._process_inputs(actual, expected, id=id)
         super().__init__(actual, expected, id=id, **other_parameters)
 
-        self.rtol, self.atol = get_tolerances(
-            *[self._TYPE_TO_DTYPE[type(input)] for input in (actual, expected)], rtol=rtol, atol=atol, id=id
-        )
+        if rtol is None and atol is None:
+            actual_rtol, actual_atol = self._TYPE_TO_TOLERANCES[type(actual)]
+            expected_rtol, expected_atol = self._TYPE_TO_TOLERANCES[type(expected)]
+            self.rtol = max(actual_rtol, expected_rtol)
+            self.atol = max(actual_atol, expected_atol)
+        else:
+            # `get_tolerances` also handles the error case of only one tolerance being specified.
+            self.rtol, self.atol = get_tolerances(
+                *[self._TYPE_TO_DTYPE[type(input)] for input in (actual, expected)], rtol=rtol, atol=atol, id=id
+            )
         self.equal_nan = equal_nan
         self.check_dtype = check_dtype
 
-    @property
-    def _supported_types(self) -> Tuple[Type, ...]:
-        cls = list(self._NUMBER_TYPES)
-        if NUMPY_AVAILABLE:
-            cls.append(np.number)
-        return tuple(cls)
-
     def _process_inputs(
         self, actual: Any, expected: Any, *, id: Tuple[Any, ...]
     ) -> Tuple[Union[int, float, complex], Union[int, float, complex]]:
@@ -492,13 +654,18 @@ class NumberPair(Pair):
         if self.actual == self.expected:
             return
 
-        if self.equal_nan and cmath.isnan(self.actual) and cmath.isnan(self.expected):
-            return
-
         abs_diff = abs(self.actual - self.expected)
         tolerance = self.atol + self.rtol * abs(self.expected)
 
-        if cmath.isfinite(abs_diff) and abs_diff <= tolerance:
+        # `abs_diff` is a non-negative real number even for complex inputs, so the cheaper `math.isfinite` suffices.
+        # The check cannot be dropped: for an infinite `self.expected` the tolerance is infinite as well and the
+        # comparison alone would consider any finite `self.actual` close. It is evaluated second, since on the hot
+        # path both values are regular floats and the comparison already rejects a NaN difference.
+        if abs_diff <= tolerance and math.isfinite(abs_diff):
+            return
+
+        # Rare path, thus checked last: a NaN difference means at least one of the inputs is NaN.
+        if self.equal_nan and cmath.isnan(self.actual) and cmath.isnan(self.expected):
             return
 
         raise self._make_error_meta(
@@ -526,7 +693,8 @@ class TensorLikePair(Pair):
         equal_nan (bool): If ``True``, two ``NaN`` values are considered equal. Defaults to ``False``.
         check_device (bool): If ``True`` (default), asserts that corresponding tensors are on the same
             :attr:`~torch.Tensor.device`. If this check is disabled, tensors on different
-            :attr:`~torch.Tensor.device`'s are moved to the CPU before being compared.
+            :attr:`~torch.Tensor.device`'s are moved to a common :attr:`~torch.Tensor.device` before being compared:
+            a CUDA device if either one lives on one and the CPU otherwise.
         check_dtype (bool): If ``True`` (default), asserts that corresponding tensors have the same ``dtype``. If this
             check is disabled, tensors with different ``dtype``'s are promoted  to a common ``dtype`` (according to
             :func:`torch.promote_types`) before being compared.
@@ -539,6 +707,18 @@ class TensorLikePair(Pair):
             :meth:`~torch.Tensor.coalesce`'ed before being compared.
     """
 
+    __slots__ = (
+        "rtol",
+        "atol",
+        "equal_nan",
+        "check_device",
+        "check_dtype",
+        "check_layout",
+        "check_stride",
+        "check_is_coalesced",
+        "_compare_in_source_dtype",
+    )
+
     def __init__(
         self,
         actual: Any,
@@ -554,6 +734,7 @@ class TensorLikePair(Pair):
         check_layout: bool = True,
         check_stride: bool = False,
         check_is_coalesced: bool = True,
+        _compare_in_source_dtype: bool = False,
         **other_parameters: Any,
     ):
         actual, expected = self._process_inputs(actual, expected, id=id, allow_subclasses=allow_subclasses)
@@ -566,6 +747,11 @@ class TensorLikePair(Pair):
         self.check_layout = check_layout
         self.check_stride = check_stride
         self.check_is_coalesced = check_is_coalesced
+        # Private escape hatch for performance sensitive callers: skip the promotion copies of reduced precision
+        # inputs and compare them in their source dtype. The elementwise kernels upcast to single precision
+        # in-register anyway, but the intermediate tolerance arithmetic is rounded to the source dtype, so the
+        # comparison can be marginally stricter than the promoted default. Hence opt-in and off by default.
+        self._compare_in_source_dtype = _compare_in_source_dtype
 
     def _process_inputs(
         self, actual: Any, expected: Any, *, id: Tuple[Any, ...], allow_subclasses: bool
@@ -628,6 +814,18 @@ class TensorLikePair(Pair):
         are optional and can be disabled through the corresponding ``check_*`` flag during construction of the pair.
         """
 
+        # Fast path: in the vast majority of comparisons all attributes match and none of the itemized checks below,
+        # each costing multiple attribute accesses and comparisons, needs to run. A single tuple comparison is
+        # performed in C and detects this case. Quantized tensors and enabled stride checks fall through, since their
+        # extra attributes are not covered by the tuples.
+        if (
+            not self.check_stride
+            and not actual.is_quantized
+            and (actual.shape, actual.dtype, actual.device, actual.layout, actual.is_quantized)
+            == (expected.shape, expected.dtype, expected.device, expected.layout, expected.is_quantized)
+        ):
+            return
+
         def raise_mismatch_error(attribute_name: str, actual_value: Any, expected_value: Any) -> NoReturn:
             raise self._make_error_meta(
                 AssertionError,
@@ -659,10 +857,12 @@ class TensorLikePair(Pair):
 
         If ``actual`` and ``expected`` are ...
 
-        - ... not on the same :attr:`~torch.Tensor.device`, they are moved CPU memory.
+        - ... not on the same :attr:`~torch.Tensor.device`, they are moved to a CUDA device if either one lives on
+            one, and to CPU memory otherwise.
         - ... not of the same ``dtype``, they are promoted  to a common ``dtype`` (according to
             :func:`torch.promote_types`).
-        - ... not of the same ``layout``, they are converted to strided tensors.
+        - ... not of the same ``layout``, the sparse COO tensor is converted to sparse CSR if the other tensor uses
+            that layout and the sparsity patterns match. Otherwise, they are converted to strided tensors.
 
         Args:
             actual (Tensor): Actual tensor.
@@ -672,8 +872,16 @@ class TensorLikePair(Pair):
             (Tuple[Tensor, Tensor]): Equalized tensors.
         """
         if actual.device != expected.device:
-            actual = actual.cpu()
-            expected = expected.cpu()
+            # Moving one tensor to the others CUDA device keeps the subsequent elementwise comparison and reduction
+            # on the accelerator. Falling back to the CPU would instead transfer both tensors over PCIe and perform
+            # the comparison without the GPU parallelism and memory bandwidth.
+            if actual.is_cuda or expected.is_cuda:
+                device = actual.device if actual.is_cuda else expected.device
+                actual = actual.to(device)
+                expected = expected.to(device)
+            else:
+                actual = actual.cpu()
+                expected = expected.cpu()
 
         if actual.dtype != expected.dtype:
             dtype = torch.promote_types(actual.dtype, expected.dtype)
@@ -681,13 +889,55 @@ class TensorLikePair(Pair):
             expected = expected.to(dtype)
 
         if actual.layout != expected.layout:
+            # If one tensor is sparse COO and the other one sparse CSR, converting the COO tensor to CSR is much
+            # cheaper than densifying both, since it only touches the metadata of the nnz specified elements. This is
+            # only possible if the COO tensor can be represented in CSR format and both tensors specify the same
+            # elements, because the sparse comparison requires equal sparsity patterns.
+            if {actual.layout, expected.layout} == {torch.sparse_coo, torch.sparse_csr}:
+                coo, csr = (actual, expected) if actual.layout == torch.sparse_coo else (expected, actual)
+                if coo.sparse_dim() == 2 and coo.dense_dim() == 0:
+                    converted = coo.coalesce().to_sparse_csr()
+                    if torch.equal(converted.crow_indices(), csr.crow_indices()) and torch.equal(
+                        converted.col_indices(), csr.col_indices()
+                    ):
+                        if actual.layout == torch.sparse_coo:
+                            return converted, expected
+                        else:
+                            return actual, converted
+
             # These checks are needed, since Tensor.to_dense() fails on tensors that are already strided
             actual = actual.to_dense() if actual.layout != torch.strided else actual
             expected = expected.to_dense() if expected.layout != torch.strided else expected
 
         return actual, expected
 
+    @staticmethod
+    def _reads_same_memory(actual: torch.Tensor, expected: torch.Tensor, *, equal_nan: bool) -> bool:
+        """Checks if both tensors are strided views reading the exact same elements from the same memory.
+
+        In that case every element trivially compares equal to itself and the elementwise comparison can be skipped.
+        The only exception are NaN's, which compare unequal to themselves, so the shortcut is limited to dtypes that
+        cannot hold them unless ``equal_nan`` is set anyway.
+        """
+        return (
+            actual.layout == torch.strided
+            and expected.layout == torch.strided
+            and not actual.is_quantized
+            and actual.dtype == expected.dtype
+            and (equal_nan or not (actual.dtype.is_floating_point or actual.dtype.is_complex))
+            # Conjugate and negative views share data pointer and strides with their base, but read different values,
+            # so the bits have to match for the tensors to be element-for-element identical.
+            and actual.is_conj() == expected.is_conj()
+            and actual.is_neg() == expected.is_neg()
+            and actual.data_ptr() == expected.data_ptr()
+            and actual.data_ptr() != 0
+            and actual.stride() == expected.stride()
+        )
+
     def _compare_values(self, actual: torch.Tensor, expected: torch.Tensor) -> None:
+        if self._reads_same_memory(actual, expected, equal_nan=self.equal_nan):
+            return
+
         if actual.is_quantized:
             compare_fn = self._compare_quantized_values
         elif actual.is_sparse:
@@ -729,32 +979,65 @@ class TensorLikePair(Pair):
         - the indices for equality, and
         - the values for closeness.
         """
-        if actual.sparse_dim() != expected.sparse_dim():
+        # For the same object, the indices trivially match and the values read the same memory, so the member
+        # comparisons can be skipped entirely. As in `_reads_same_memory`, NaN values compare unequal to themselves,
+        # which limits the shortcut to value dtypes that cannot hold them unless equal_nan is set anyway.
+        if actual is expected and (equal_nan or not (actual.dtype.is_floating_point or actual.dtype.is_complex)):
+            return
+
+        # Each of these accessors crosses into C++, so they are hoisted into locals instead of being re-invoked for
+        # the error messages.
+        actual_sparse_dim = actual.sparse_dim()
+        expected_sparse_dim = expected.sparse_dim()
+        if actual_sparse_dim != expected_sparse_dim:
             raise self._make_error_meta(
                 AssertionError,
                 (
                     f"The number of sparse dimensions in sparse COO tensors does not match: "
-                    f"{actual.sparse_dim()} != {expected.sparse_dim()}"
+                    f"{actual_sparse_dim} != {expected_sparse_dim}"
                 ),
             )
 
-        if actual._nnz() != expected._nnz():
+        actual_nnz = actual._nnz()
+        expected_nnz = expected._nnz()
+        if actual_nnz != expected_nnz:
             raise self._make_error_meta(
                 AssertionError,
                 (
                     f"The number of specified values in sparse COO tensors does not match: "
-                    f"{actual._nnz()} != {expected._nnz()}"
+                    f"{actual_nnz} != {expected_nnz}"
                 ),
             )
 
+        # On CUDA, every member comparison synchronizes with the host at least once to transfer its verdict. This
+        # combined screen evaluates all member checks on the device and transfers a single boolean instead; only
+        # failing comparisons fall back to the sequential member comparisons that produce the error messages. The
+        # values are promoted once up front, so a failing screen does not repeat the promotion copies in the
+        # fallback. On CPU the sequential path is kept, since its torch.equal screen already decides passing
+        # comparisons on the unpromoted values without a host round trip to hide.
+        actual_values = actual._values()
+        expected_values = expected._values()
+        if actual.is_cuda:
+            actual_values, expected_values = self._promote_for_comparison(actual_values, expected_values)
+            screen = torch.stack(
+                (
+                    torch.all(actual._indices() == expected._indices()),
+                    torch.all(
+                        torch.isclose(actual_values, expected_values, rtol=rtol, atol=atol, equal_nan=equal_nan)
+                    ),
+                )
+            )
+            if bool(torch.all(screen)):
+                return
+
         self._compare_regular_values_equal(
             actual._indices(),
             expected._indices(),
             identifier="Sparse COO indices",
         )
         self._compare_regular_values_close(
-            actual._values(),
-            expected._values(),
+            actual_values,
+            expected_values,
             rtol=rtol,
             atol=atol,
             equal_nan=equal_nan,
@@ -771,15 +1054,39 @@ class TensorLikePair(Pair):
         - the crow_indices for equality, and
         - the values for closeness.
         """
-        if actual._nnz() != expected._nnz():
+        # See `_compare_sparse_coo_values` for the rationale of this shortcut.
+        if actual is expected and (equal_nan or not (actual.dtype.is_floating_point or actual.dtype.is_complex)):
+            return
+
+        # See `_compare_sparse_coo_values` for the rationale of the hoisted accessors.
+        actual_nnz = actual._nnz()
+        expected_nnz = expected._nnz()
+        if actual_nnz != expected_nnz:
             raise self._make_error_meta(
                 AssertionError,
                 (
                     f"The number of specified values in sparse CSR tensors does not match: "
-                    f"{actual._nnz()} != {expected._nnz()}"
+                    f"{actual_nnz} != {expected_nnz}"
                 ),
             )
 
+        # See `_compare_sparse_coo_values` for the rationale of this screen and the hoisted promotion.
+        actual_values = actual.values()
+        expected_values = expected.values()
+        if actual.is_cuda:
+            actual_values, expected_values = self._promote_for_comparison(actual_values, expected_values)
+            screen = torch.stack(
+                (
+                    torch.all(actual.crow_indices() == expected.crow_indices()),
+                    torch.all(actual.col_indices() == expected.col_indices()),
+                    torch.all(
+                        torch.isclose(actual_values, expected_values, rtol=rtol, atol=atol, equal_nan=equal_nan)
+                    ),
+                )
+            )
+            if bool(torch.all(screen)):
+                return
+
         self._compare_regular_values_equal(
             actual.crow_indices(),
             expected.crow_indices(),
@@ -791,8 +1098,8 @@ class TensorLikePair(Pair):
             identifier="Sparse CSR col_indices",
         )
         self._compare_regular_values_close(
-            actual.values(),
-            expected.values(),
+            actual_values,
+            expected_values,
             rtol=rtol,
             atol=atol,
             equal_nan=equal_nan,
@@ -808,6 +1115,20 @@ class TensorLikePair(Pair):
             identifier: Optional[Union[str, Callable[[str], str]]] = None,
     ) -> None:
         """Checks if the values of two tensors are equal."""
+        # Without equal_nan, the torch.equal screen inside the close comparison already decides the passing case in
+        # the input dtype. With it, an equivalent in-dtype screen is performed here, since torch.equal treats NaN's as
+        # unequal. Either way, only failing comparisons pay for the promotion and the mismatch statistics.
+        # torch.complex32 is excluded, since the eq and isnan kernels do not support it; it reaches its first kernel
+        # only after the promotion inside the close comparison.
+        if (
+            equal_nan
+            and actual.ndim > 0
+            and actual.dtype == expected.dtype
+            and actual.dtype != torch.complex32
+            and (actual.dtype.is_floating_point or actual.dtype.is_complex)
+            and bool(torch.all((actual == expected) | (actual.isnan() & expected.isnan())))
+        ):
+            return
         self._compare_regular_values_close(actual, expected, rtol=0, atol=0, equal_nan=equal_nan, identifier=identifier)
 
     def _compare_regular_values_close(
@@ -821,15 +1142,52 @@ class TensorLikePair(Pair):
         identifier: Optional[Union[str, Callable[[str], str]]] = None,
     ) -> None:
         """Checks if the values of two tensors are close up to a desired tolerance."""
+        # `_compare_values` already applies this shortcut for its direct inputs, but this method is also invoked on
+        # derived tensors, e.g. the value members of sparse inputs, which may alias each other as well.
+        if self._reads_same_memory(actual, expected, equal_nan=equal_nan):
+            return
+
+        # For zero-dimensional inputs, extracting the scalars and evaluating the closeness definition in Python is
+        # cheaper than launching any comparison kernel only to transfer a boolean afterwards. Python arithmetic is
+        # performed in double precision and thus at least as precise as any promoted tensor comparison. This mirrors
+        # the comparison in `NumberPair.compare`.
+        if actual.ndim == 0:
+            # `Tensor.item` has no ComplexHalf support, so those inputs are promoted first, as they were before this
+            # fast path existed; the promotion copy handles the dtype fine.
+            if actual.dtype == torch.complex32:
+                actual, expected = self._promote_for_comparison(actual, expected)
+            actual_scalar = actual.item()
+            expected_scalar = expected.item()
+            if actual_scalar == expected_scalar or (
+                equal_nan and cmath.isnan(actual_scalar) and cmath.isnan(expected_scalar)
+            ):
+                return
+            abs_diff = abs(actual_scalar - expected_scalar)
+            # The finiteness check mirrors `torch.isclose`: an infinite difference, e.g. from comparing against an
+            # infinite expected value, never lies within a finite tolerance.
+            if abs_diff <= atol + rtol * abs(expected_scalar) and math.isfinite(abs_diff):
+                return
+            msg = make_scalar_mismatch_msg(actual_scalar, expected_scalar, rtol=rtol, atol=atol, identifier=identifier)
+            raise self._make_error_meta(AssertionError, msg)
+
+        # Bitwise equality implies closeness for every tolerance, so an exact match makes the promotion copies and
+        # the tolerance-aware comparison unnecessary. NaN's compare unequal under `torch.equal`, which keeps this
+        # path from bypassing the equal_nan handling. torch.complex32 is excluded, since the equality kernels do not
+        # support it; it reaches its first kernel only after the promotion below, like before this screen existed.
+        if actual.dtype == expected.dtype and actual.dtype != torch.complex32 and torch.equal(actual, expected):
+            return
+
         actual, expected = self._promote_for_comparison(actual, expected)
-        matches = torch.isclose(actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan)
-        if torch.all(matches):
+        # `torch.allclose` fuses the elementwise comparison and the reduction into a single operator call, so the
+        # happy path only acquires and releases the GIL once and, for CUDA inputs, synchronizes a single boolean
+        # instead of transferring the full match mask. The mask is only materialized to build the error message.
+        if torch.allclose(actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan):
             return
+        matches = torch.isclose(actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan)
 
-        if actual.shape == torch.Size([]):
-            msg = make_scalar_mismatch_msg(actual.item(), expected.item(), rtol=rtol, atol=atol, identifier=identifier)
-        else:
-            msg = make_tensor_mismatch_msg(actual, expected, ~matches, rtol=rtol, atol=atol, identifier=identifier)
+        # Zero-dimensional inputs never reach this point, since the scalar fast path above returns or raises with
+        # `make_scalar_mismatch_msg` for them.
+        msg = make_tensor_mismatch_msg(actual, expected, matches, rtol=rtol, atol=atol, identifier=identifier)
         raise self._make_error_meta(AssertionError, msg)
 
     def _promote_for_comparison(
@@ -838,16 +1196,19 @@ class TensorLikePair(Pair):
         """Promotes the inputs to the comparison dtype based on the input dtype.
 
         Returns:
-            Inputs promoted to the highest precision dtype of the same dtype category. :class:`torch.bool` is treated
-            as integral dtype.
+            Inputs promoted to a dtype of the same category in which the comparison arithmetic is exact.
+            :class:`torch.bool` is treated as integral dtype.
         """
         # This is called after self._equalize_attributes() and thus `actual` and `expected` already have the same dtype.
-        if actual.dtype.is_complex:
-            dtype = torch.complex128
-        elif actual.dtype.is_floating_point:
-            dtype = torch.float64
-        else:
-            dtype = torch.int64
+        # torch.complex32 is deliberately not eligible, since torch.isclose does not support it and the comparison
+        # would fail with a RuntimeError instead of a verdict.
+        if self._compare_in_source_dtype and actual.dtype in (torch.float16, torch.bfloat16):
+            return actual, expected
+        dtype = _COMPARISON_DTYPES.get(actual.dtype, torch.int64)
+        # `Tensor.to` with a matching dtype is a no-op, but checking upfront also skips the second dispatch when only
+        # one of the tensors needs the conversion.
+        if actual.dtype == dtype:
+            return actual, expected
         return actual.to(dtype), expected.to(dtype)
 
     def extra_repr(self) -> Sequence[str]:
@@ -876,7 +1237,7 @@ def originate_pairs(
     """Originates pairs from the individual inputs.
 
     ``actual`` and ``expected`` can be possibly nested :class:`~collections.abc.Sequence`'s or
-    :class:`~collections.abc.Mapping`'s. In this case the pairs are originated by recursing through them.
+    :class:`~collections.abc.Mapping`'s. In this case the pairs are originated by traversing through them.
 
     Args:
         actual (Any): Actual input.
@@ -899,105 +1260,98 @@ def originate_pairs(
     Returns:
         (List[Pair]): Originated pairs.
     """
-    # We explicitly exclude str's here since they are self-referential and would cause an infinite recursion loop:
-    # "a" == "a"[0][0]...
-    if (
-        isinstance(actual, sequence_types)
-        and not isinstance(actual, str)
-        and isinstance(expected, sequence_types)
-        and not isinstance(expected, str)
-    ):
-        actual_len = len(actual)
-        expected_len = len(expected)
-        if actual_len != expected_len:
-            raise ErrorMeta(
-                AssertionError, f"The length of the sequences mismatch: {actual_len} != {expected_len}", id=id
-            )
-
-        pairs = []
-        for idx in range(actual_len):
-            pairs.extend(
-                originate_pairs(
-                    actual[idx],
-                    expected[idx],
-                    pair_types=pair_types,
-                    sequence_types=sequence_types,
-                    mapping_types=mapping_types,
-                    id=(*id, idx),
-                    **options,
+    pairs: List[Pair] = []
+    # The inputs are traversed depth-first with an explicit stack rather than with recursive calls, which avoids
+    # re-paying the call overhead of the keyword-heavy signature for every leaf and keeps deeply nested structures
+    # away from the interpreter recursion limit. Children are pushed in reverse, so they are popped in order and the
+    # pairs as well as the first failure match the previous recursive traversal exactly.
+    stack: List[Tuple[Any, Any, Tuple[Any, ...]]] = [(actual, expected, id)]
+    while stack:
+        actual, expected, id = stack.pop()
+
+        # We explicitly exclude str's here since they are self-referential and would cause an infinite traversal loop:
+        # "a" == "a"[0][0]...
+        if (
+            isinstance(actual, sequence_types)
+            and not isinstance(actual, str)
+            and isinstance(expected, sequence_types)
+            and not isinstance(expected, str)
+        ):
+            actual_len = len(actual)
+            expected_len = len(expected)
+            if actual_len != expected_len:
+                raise ErrorMeta(
+                    AssertionError, f"The length of the sequences mismatch: {actual_len} != {expected_len}", id=id
                 )
-            )
-        return pairs
-
-    elif isinstance(actual, mapping_types) and isinstance(expected, mapping_types):
-        actual_keys = set(actual.keys())
-        expected_keys = set(expected.keys())
-        if actual_keys != expected_keys:
-            missing_keys = expected_keys - actual_keys
-            additional_keys = actual_keys - expected_keys
-            raise ErrorMeta(
-                AssertionError,
-                (
-                    f"The keys of the mappings do not match:\n"
-                    f"Missing keys in the actual mapping: {sorted(missing_keys)}\n"
-                    f"Additional keys in the actual mapping: {sorted(additional_keys)}"
-                ),
-                id=id,
-            )
 
-        keys: Collection = actual_keys
-        # Since the origination aborts after the first failure, we try to be deterministic
-        with contextlib.suppress(Exception):
-            keys = sorted(keys)
-
-        pairs = []
-        for key in keys:
-            pairs.extend(
-                originate_pairs(
-                    actual[key],
-                    expected[key],
-                    pair_types=pair_types,
-                    sequence_types=sequence_types,
-                    mapping_types=mapping_types,
-                    id=(*id, key),
-                    **options,
+            for idx in reversed(range(actual_len)):
+                stack.append((actual[idx], expected[idx], (*id, idx)))
+
+        elif isinstance(actual, mapping_types) and isinstance(expected, mapping_types):
+            # Equal lengths plus every actual key being present in expected implies equal key sets. Checking this
+            # directly stays on the mappings' own constant-time lookups; the sets are only materialized to compute
+            # the difference for the error message.
+            if len(actual) != len(expected) or any(key not in expected for key in actual):
+                actual_keys = set(actual.keys())
+                expected_keys = set(expected.keys())
+                missing_keys = expected_keys - actual_keys
+                additional_keys = actual_keys - expected_keys
+                raise ErrorMeta(
+                    AssertionError,
+                    (
+                        f"The keys of the mappings do not match:\n"
+                        f"Missing keys in the actual mapping: {sorted(missing_keys)}\n"
+                        f"Additional keys in the actual mapping: {sorted(additional_keys)}"
+                    ),
+                    id=id,
                 )
-            )
-        return pairs
 
-    else:
-        for pair_type in pair_types:
-            try:
-                return [pair_type(actual, expected, id=id, **options)]
-            # Raising an `UnsupportedInputs` during origination indicates that the pair type is not able to handle the
-            # inputs. Thus, we try the next pair type.
-            except UnsupportedInputs:
-                continue
-            # Raising an `ErrorMeta` during origination is the orderly way to abort and so we simply re-raise it. This
-            # is only in a separate branch, because the one below would also except it.
-            except ErrorMeta:
-                raise
-            # Raising any other exception during origination is unexpected and will give some extra information about
-            # what happened. If applicable, the exception should be expected in the future.
-            except Exception as error:
-                raise RuntimeError(
-                    f"Originating a {pair_type.__name__}() at item {''.join(str([item]) for item in id)} with\n\n"
-                    f"{type(actual).__name__}(): {actual}\n\n"
-                    f"and\n\n"
-                    f"{type(expected).__name__}(): {expected}\n\n"
-                    f"resulted in the unexpected exception above. "
-                    f"If you are a user and see this message during normal operation "
-                    "please file an issue at https://github.com/pytorch/pytorch/issues. "
-                    "If you are a developer and working on the comparison functions, "
-                    "please except the previous error and raise an expressive `ErrorMeta` instead."
-                ) from error
+            keys: Collection = actual.keys()
+            # Since the origination aborts after the first failure, we try to be deterministic
+            with contextlib.suppress(Exception):
+                keys = sorted(keys)
+
+            for key in reversed(list(keys)):
+                stack.append((actual[key], expected[key], (*id, key)))
+
         else:
-            raise ErrorMeta(
-                TypeError,
-                f"No comparison pair was able to handle inputs of type {type(actual)} and {type(expected)}.",
-                id=id,
-            )
+            for pair_type in pair_types:
+                try:
+                    # `can_handle` cheaply rules out pair types without entering their constructors.
+                    if not pair_type.can_handle(actual, expected):
+                        continue
+                    # A `None` return indicates that the pair type is not able to handle the inputs. Thus, we try the
+                    # next pair type.
+                    pair = pair_type.try_build(actual, expected, id=id, **options)
+                    if pair is not None:
+                        pairs.append(pair)
+                        break
+                # Raising an `ErrorMeta` during origination is the orderly way to abort and so we simply re-raise it.
+                # This is only in a separate branch, because the one below would also except it.
+                except ErrorMeta:
+                    raise
+                # Raising any other exception during origination is unexpected and will give some extra information
+                # about what happened. If applicable, the exception should be expected in the future.
+                except Exception as error:
+                    raise RuntimeError(
+                        f"Originating a {pair_type.__name__}() at item {''.join(str([item]) for item in id)} with\n\n"
+                        f"{type(actual).__name__}(): {actual}\n\n"
+                        f"and\n\n"
+                        f"{type(expected).__name__}(): {expected}\n\n"
+                        f"resulted in the unexpected exception above. "
+                        f"If you are a user and see this message during normal operation "
+                        "please file an issue at https://github.com/pytorch/pytorch/issues. "
+                        "If you are a developer and working on the comparison functions, "
+                        "please except the previous error and raise an expressive `ErrorMeta` instead."
+                    ) from error
+            else:
+                raise ErrorMeta(
+                    TypeError,
+                    f"No comparison pair was able to handle inputs of type {type(actual)} and {type(expected)}.",
+                    id=id,
+                )
 
+    return pairs
 
 def assert_equal(
     actual: Any,
@@ -1038,12 +1392,12 @@ def assert_equal(
         # Explicitly raising from None to hide the internal traceback
         raise error_meta.to_error() from None
 
-    error_metas: List[ErrorMeta] = []
-    for pair in pairs:
+    def compare_pair(pair: Pair) -> Optional[ErrorMeta]:
         try:
             pair.compare()
+            return None
         except ErrorMeta as error_meta:
-            error_metas.append(error_meta)
+            return error_meta
         # Raising any exception besides `ErrorMeta` while comparing is unexpected and will give some extra information
         # about what happened. If applicable, the exception should be expected in the future.
         except Exception as error:
@@ -1057,6 +1411,24 @@ def assert_equal(
                 "please except the previous error and raise an expressive `ErrorMeta` instead."
             ) from error
 
+    # The comparison kernels release the GIL inside ATen, so comparing many CPU tensor pairs profits from thread
+    # parallelism. The pool is restricted to plain `TensorLikePair`'s on the CPU: other pair types are too cheap to
+    # offset the thread overhead, and CUDA comparisons are kept on the calling thread to preserve its stream
+    # semantics. A short-lived pool per call avoids keeping idle threads alive across, e.g., a fork. The first
+    # failure is determined by pair order either way, since `Executor.map` yields the results in order.
+    if (
+        len(pairs) > 8
+        and all(
+            type(pair) is TensorLikePair and not pair.actual.is_cuda and not pair.expected.is_cuda for pair in pairs
+        )
+    ):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(compare_pair, pairs))
+    else:
+        results = [compare_pair(pair) for pair in pairs]
+
+    error_metas: List[ErrorMeta] = [error_meta for error_meta in results if error_meta is not None]
+
     if not error_metas:
         return
 
@@ -1128,7 +1500,8 @@ def assert_close(
         equal_nan (Union[bool, str]): If ``True``, two ``NaN`` values will be considered equal.
         check_device (bool): If ``True`` (default), asserts that corresponding tensors are on the same
             :attr:`~torch.Tensor.device`. If this check is disabled, tensors on different
-            :attr:`~torch.Tensor.device`'s are moved to the CPU before being compared.
+            :attr:`~torch.Tensor.device`'s are moved to a common :attr:`~torch.Tensor.device` before being compared:
+            a CUDA device if either one lives on one and the CPU otherwise.
         check_dtype (bool): If ``True`` (default), asserts that corresponding tensors have the same ``dtype``. If this
             check is disabled, tensors with different ``dtype``'s are promoted  to a common ``dtype`` (according to
             :func:`torch.promote_types`) before being compared.